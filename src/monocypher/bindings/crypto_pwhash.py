@@ -1,7 +1,38 @@
+import threading
 from monocypher.utils import ensure_range
 from monocypher._monocypher import lib, ffi
 
 
+# Argon2i needs a work area of nb_blocks KiB. Allocating (and faulting in)
+# that much memory on every call is a large part of the cost of hashing,
+# so each thread keeps its most recently used work area around and reuses
+# it when called again with the same nb_blocks. Only work areas of up to
+# _MAX_CACHED_BLOCKS KiB are kept, to bound the memory held per thread.
+# crypto_argon2i_general wipes the work area itself before returning.
+_MAX_CACHED_BLOCKS = 16 * 1024
+_local = threading.local()
+
+
+def _new_work_area(nb_blocks):
+    size = nb_blocks * 1024
+    work_area = lib.malloc(size)
+    if work_area == ffi.NULL:  # pragma: no cover
+        raise RuntimeError('malloc() returned NULL')
+    return ffi.gc(work_area, lib.free, size=size)
+
+
+def _get_work_area(nb_blocks):
+    cached = getattr(_local, 'work_area', None)
+    if cached is not None and cached[0] == nb_blocks:
+        return cached[1]
+
+    # drop the old work area before allocating the new one
+    _local.work_area = None
+    work_area = _new_work_area(nb_blocks)
+    _local.work_area = (nb_blocks, work_area)
+    return work_area
+
+
 def crypto_argon2i(
     password,
     salt,
@@ -16,9 +47,8 @@ def crypto_argon2i(
     ensure_range('nb_blocks', nb_blocks, min=8)
     ensure_range('nb_iterations', nb_iterations, min=1)
 
-    work_area = lib.malloc(nb_blocks * 1024)
-    if work_area == ffi.NULL:  # pragma: no cover
-        raise RuntimeError('malloc() returned NULL')
+    cache = nb_blocks <= _MAX_CACHED_BLOCKS
+    work_area = _get_work_area(nb_blocks) if cache else _new_work_area(nb_blocks)
 
     try:
         password = ffi.from_buffer('uint8_t[]', password)
@@ -37,4 +67,5 @@ def crypto_argon2i(
         )
         return bytes(hash)
     finally:
-        lib.free(work_area)
+        if not cache:
+            ffi.release(work_area)
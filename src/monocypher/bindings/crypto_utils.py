@@ -2,11 +2,17 @@ from monocypher.utils import ensure_length
 from monocypher._monocypher import lib, ffi
 
 
+# bound once to avoid an attribute lookup on lib per call
+_verify16 = lib.crypto_verify16
+_verify32 = lib.crypto_verify32
+_verify64 = lib.crypto_verify64
+
+
 def crypto_verify16(a, b):
     ensure_length('a', a, 16)
     ensure_length('b', b, 16)
 
-    return lib.crypto_verify16(
+    return _verify16(
         ffi.from_buffer('uint8_t[16]', a),
         ffi.from_buffer('uint8_t[16]', b),
     ) == 0
@@ -16,7 +22,7 @@ def crypto_verify32(a, b):
     ensure_length('a', a, 32)
     ensure_length('b', b, 32)
 
-    return lib.crypto_verify32(
+    return _verify32(
         ffi.from_buffer('uint8_t[32]', a),
         ffi.from_buffer('uint8_t[32]', b),
     ) == 0
@@ -26,7 +32,7 @@ def crypto_verify64(a, b):
     ensure_length('a', a, 64)
     ensure_length('b', b, 64)
 
-    return lib.crypto_verify64(
+    return _verify64(
         ffi.from_buffer('uint8_t[64]', a),
         ffi.from_buffer('uint8_t[64]', b),
     ) == 0
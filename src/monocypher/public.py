@@ -1,11 +1,16 @@
 from monocypher.utils import ensure_bytes_with_length, ensure, Key, random
 from monocypher.bindings.crypto_public import crypto_key_exchange, crypto_key_exchange_public_key
-from monocypher.secret import SecretBox
+from monocypher.bindings.crypto_aead import crypto_lock
+from monocypher.secret import SecretBox, CryptoError
 
 
 __all__ = ('PublicKey', 'PrivateKey', 'Box')
 
 
+# SealedBox uses a fresh ephemeral key per message, so the nonce is fixed.
+_ZERO_NONCE = bytes(SecretBox.NONCE_SIZE)
+
+
 class PublicKey(Key):
     """
     X25519 public key. This can be published.
@@ -21,6 +26,14 @@ class PublicKey(Key):
         ensure_bytes_with_length('pk', pk, self.KEY_SIZE)
         self._pk = pk
 
+    @classmethod
+    def _from_trusted(cls, pk):
+        # pk is produced internally (e.g. by Monocypher) and known
+        # to be valid, so skip the checks done in __init__.
+        obj = cls.__new__(cls)
+        obj._pk = pk
+        return obj
+
     def __bytes__(self):
         return self._pk
 
@@ -34,11 +47,21 @@ class PrivateKey(Key):
 
     KEY_SIZE = 32  #: Length of a private key in bytes.
 
-    __slots__ = ('_sk',)
+    __slots__ = ('_sk', '_public_key')
 
     def __init__(self, sk):
         ensure_bytes_with_length('sk', sk, self.KEY_SIZE)
         self._sk = sk
+        self._public_key = None
+
+    @classmethod
+    def _from_trusted(cls, sk):
+        # sk is produced internally and known to be valid,
+        # so skip the checks done in __init__.
+        obj = cls.__new__(cls)
+        obj._sk = sk
+        obj._public_key = None
+        return obj
 
     @classmethod
     def generate(cls):
@@ -49,6 +72,20 @@ class PrivateKey(Key):
         """
         return cls(random(cls.KEY_SIZE))
 
+    @classmethod
+    def generate_with_public(cls):
+        """
+        Generates a random :class:`.PrivateKey` object together with its
+        :class:`.PublicKey`. This is equivalent to, but cheaper than,
+        calling :py:meth:`.generate` and then :py:attr:`.public_key`.
+
+        :rtype: (:class:`.PrivateKey`, :class:`.PublicKey`)
+        """
+        private_key = cls._from_trusted(random(cls.KEY_SIZE))
+        public_key = PublicKey._from_trusted(crypto_key_exchange_public_key(private_key._sk))
+        private_key._public_key = public_key
+        return private_key, public_key
+
     @property
     def public_key(self):
         """
@@ -56,7 +93,12 @@ class PrivateKey(Key):
 
         :rtype: :class:`.PublicKey`
         """
-        return PublicKey(crypto_key_exchange_public_key(self._sk))
+        # computed on first access; _sk never changes. Instances
+        # unpickled from older releases do not have the slot set.
+        public_key = getattr(self, '_public_key', None)
+        if public_key is None:
+            public_key = self._public_key = PublicKey._from_trusted(crypto_key_exchange_public_key(self._sk))
+        return public_key
 
     def __bytes__(self):
         return self._sk
@@ -76,12 +118,12 @@ class Box(SecretBox):
     __slots__ = ()
 
     def __init__(self, your_sk, their_pk):
-        ensure(isinstance(your_sk, PrivateKey), TypeError, 'your_sk should be a PrivateKey instance')
-        ensure(isinstance(their_pk, PublicKey), TypeError, 'their_pk should be a PublicKey instance')
-        super().__init__(crypto_key_exchange(
-            your_sk.encode(),
-            their_pk.encode(),
-        ))
+        if not isinstance(your_sk, PrivateKey):
+            raise TypeError('your_sk should be a PrivateKey instance')
+        if not isinstance(their_pk, PublicKey):
+            raise TypeError('their_pk should be a PublicKey instance')
+        # read the slots directly rather than going through encode()
+        super().__init__(crypto_key_exchange(your_sk._sk, their_pk._pk))
 
     @property
     def shared_key(self):
@@ -126,12 +168,14 @@ class SealedBox:
         :param msg: The message to encrypt (bytes).
         :rtype: :py:class:`bytes`
         """
-        ephemeral_sk = PrivateKey.generate()
-        ephemeral_pk = ephemeral_sk.public_key
+        ephemeral_sk, ephemeral_pk = PrivateKey.generate_with_public()
 
-        nonce = bytes(Box.NONCE_SIZE)
-        ct = Box(ephemeral_sk, self._pk).encrypt(msg, nonce=nonce).ciphertext
-        return ephemeral_pk.encode() + ct
+        # Lock directly instead of going through Box.encrypt, which would
+        # build an EncryptedMessage (copying the ciphertext) only for us
+        # to slice it and copy it again.
+        box = Box(ephemeral_sk, self._pk)
+        mac, ct = crypto_lock(key=box.shared_key, nonce=_ZERO_NONCE, msg=msg)
+        return b''.join((ephemeral_pk.encode(), mac, ct))
 
     def decrypt(self, ciphertext):
         """
@@ -144,10 +188,18 @@ class SealedBox:
         :rtype: :py:class:`bytes`
         """
         ensure(self._sk is not None, RuntimeError, 'SecretBox cannot decrypt using a PublicKey')
+        # reject truncated ciphertexts before doing the key exchange
+        if len(ciphertext) < PublicKey.KEY_SIZE + Box.MAC_SIZE:
+            raise CryptoError('malformed ciphertext')
         e_pk = ciphertext[:PublicKey.KEY_SIZE]  # Ephemeral PublicKey
-        ct   = ciphertext[PublicKey.KEY_SIZE:]  # MAC + encrypted message
+        # MAC + encrypted message; bytes are sliced without copying,
+        # see SecretBox.decrypt
+        if isinstance(ciphertext, bytes):
+            ct = memoryview(ciphertext)[PublicKey.KEY_SIZE:]
+        else:
+            ct = ciphertext[PublicKey.KEY_SIZE:]
         box  = Box(self._sk, PublicKey(e_pk))
         return box.decrypt(
             ciphertext=ct,
-            nonce=bytes(Box.NONCE_SIZE),
+            nonce=_ZERO_NONCE,
         )
@@ -23,9 +23,8 @@ class EncryptedMessage(bytes):
 
     @classmethod
     def from_parts(cls, nonce, mac, ciphertext):
-        obj = cls(nonce + mac + ciphertext)
+        obj = cls(b''.join((nonce, mac, ciphertext)))
         obj._nonce = nonce
-        obj._ciphertext = mac + ciphertext
         return obj
 
     @property
@@ -52,7 +51,7 @@ class EncryptedMessage(bytes):
 
         :rtype: :class:`bytes`
         """
-        return self._ciphertext
+        return self[len(self._nonce):]
 
     @property
     def detached_mac(self):
@@ -61,7 +60,8 @@ class EncryptedMessage(bytes):
 
         :rtype: :class:`bytes`
         """
-        return self.ciphertext[:SecretBox.MAC_SIZE]
+        start = len(self._nonce)
+        return self[start:start + SecretBox.MAC_SIZE]
 
     @property
     def detached_ciphertext(self):
@@ -75,7 +75,7 @@ class EncryptedMessage(bytes):
 
         :rtype: :class:`bytes`
         """
-        return self.ciphertext[SecretBox.MAC_SIZE:]
+        return self[len(self._nonce) + SecretBox.MAC_SIZE:]
 
 
 class SecretBox(Key):
@@ -153,6 +153,13 @@ class SecretBox(Key):
 
         :rtype: :class:`bytes`
         """
+        # Slice immutable bytes through a memoryview so that the (possibly
+        # large) ciphertext is handed to crypto_unlock without being copied.
+        # Mutable buffers are sliced (copied) as before, so that no buffer
+        # export on the caller's object outlives this call, e.g. via the
+        # traceback of a CryptoError.
+        if isinstance(ciphertext, bytes):
+            ciphertext = memoryview(ciphertext)
         if nonce is None:
             # get from ciphertext, assume that it is encoded
             # with the default EncryptedMessage
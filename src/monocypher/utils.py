@@ -1,4 +1,5 @@
 import os
+import hmac
 from monocypher._monocypher import ffi
 
 
@@ -67,27 +68,20 @@ def ensure(cond, exc, *args):
 
 
 def ensure_length(name, value, length):
-    ensure(
-        len(value) == length,
-        TypeError,
-        '{} must have length {}'.format(name, length),
-    )
+    # These checks run on every binding call, so only
+    # build the error message when the check fails.
+    if len(value) != length:
+        raise TypeError('{} must have length {}'.format(name, length))
 
 
 def ensure_bytes_with_length(name, value, length):
-    ensure(
-        isinstance(value, bytes) and len(value) == length,
-        TypeError,
-        '{} must be bytes with length {}'.format(name, length),
-    )
+    if not (isinstance(value, bytes) and len(value) == length):
+        raise TypeError('{} must be bytes with length {}'.format(name, length))
 
 
 def ensure_range(name, value, min, max=float('+inf')):
-    ensure(
-        isinstance(value, int) and (min <= value <= max),
-        TypeError,
-        '{name} must be an integer between {min} and {max}'.format(name=name, min=min, max=max),
-    )
+    if not (isinstance(value, int) and (min <= value <= max)):
+        raise TypeError('{name} must be an integer between {min} and {max}'.format(name=name, min=min, max=max))
 
 
 class Key:
@@ -100,9 +94,13 @@ class Key:
         return hash(bytes(self))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return crypto_verify32(bytes(self), bytes(other))
+        # compare_digest is constant-time, and unlike crypto_verify32
+        # it does not need a round-trip through cffi.
+        return hmac.compare_digest(bytes(self), bytes(other))
 
 
 from monocypher.bindings.crypto_utils import crypto_wipe, crypto_verify16, crypto_verify32, crypto_verify64  # noqa: E402
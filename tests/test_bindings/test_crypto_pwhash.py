@@ -1,3 +1,4 @@
+from monocypher.bindings import crypto_pwhash
 from monocypher.bindings.crypto_pwhash import crypto_argon2i
 
 from tests.utils import get_vectors, hex2bytes
@@ -22,3 +23,23 @@ def test_argon2i_vectors():
             key,
             ad,
         ) == hash
+
+
+def test_argon2i_reuses_work_area(monkeypatch):
+    args = (b'password', b'saltsalt')
+    a = crypto_argon2i(*args, nb_blocks=8, nb_iterations=1)
+    work_area = crypto_pwhash._local.work_area
+    b = crypto_argon2i(*args, nb_blocks=8, nb_iterations=1)
+    assert crypto_pwhash._local.work_area is work_area
+    assert a == b
+
+    # replaced when nb_blocks changes
+    crypto_argon2i(*args, nb_blocks=16, nb_iterations=1)
+    assert crypto_pwhash._local.work_area is not work_area
+    assert crypto_pwhash._local.work_area[0] == 16
+
+    # work areas above the limit are not kept
+    monkeypatch.setattr(crypto_pwhash, '_MAX_CACHED_BLOCKS', 8)
+    work_area = crypto_pwhash._local.work_area
+    crypto_argon2i(*args, nb_blocks=32, nb_iterations=1)
+    assert crypto_pwhash._local.work_area is work_area
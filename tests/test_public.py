@@ -1,3 +1,4 @@
+import pickle
 from hypothesis import given
 from hypothesis.strategies import binary
 from pytest import raises
@@ -21,12 +22,41 @@ def test_public_key():
     sk = PrivateKey.generate()
     pk = sk.public_key
 
+    # cached
+    assert sk.public_key is pk
+
     # hashable
     hash(pk)
 
     assert pk == PublicKey(pk.encode())
 
 
+def test_keys_pickle():
+    sk = PrivateKey.generate()
+    for key in (sk, sk.public_key):
+        hash(key)
+        copy = pickle.loads(pickle.dumps(key))
+        assert copy == key
+        assert hash(copy) == hash(key)
+        assert copy in {key}
+
+    # pickled by a release without the cached public key
+    old = PrivateKey.__new__(PrivateKey)
+    old._sk = sk.encode()
+    copy = pickle.loads(pickle.dumps(old))
+    assert copy == sk
+    assert copy.public_key == sk.public_key
+    assert SealedBox(copy).decrypt(SealedBox(sk.public_key).encrypt(b'abc')) == b'abc'
+
+
+def test_generate_with_public():
+    sk, pk = PrivateKey.generate_with_public()
+    assert isinstance(sk, PrivateKey)
+    assert isinstance(pk, PublicKey)
+    assert sk.public_key == pk
+    assert sk == PrivateKey(sk.encode())
+
+
 MSG = binary()
 
 
@@ -38,6 +68,8 @@ def test_public_workflow(msg):
     # not allowed to give 2 PrivateKeys
     with raises(TypeError):
         Box(sk_a, sk_b)
+    with raises(TypeError):
+        Box(sk_a.public_key, sk_b.public_key)
 
     box_a = Box(sk_a, sk_b.public_key)
     box_b = Box(sk_b, sk_a.public_key)
@@ -67,6 +99,23 @@ def test_sealed_box(msg):
     with raises(CryptoError):
         SealedBox(fake_sk).decrypt(enc)
 
+    # truncated
+    with raises(CryptoError):
+        SealedBox(sk).decrypt(enc[:PublicKey.KEY_SIZE + Box.MAC_SIZE - 1])
+
+
+def test_sealed_box_decrypt_bytearray_not_pinned():
+    sk = PrivateKey.generate()
+    buf = bytearray(SealedBox(sk).encrypt(b'abc'))
+    try:
+        SealedBox(sk).decrypt(buf)
+    except TypeError:
+        # the ephemeral public key must be bytes; no buffer
+        # export may outlive the failed call
+        buf.extend(b'x')
+    else:  # pragma: no cover
+        assert False, 'bytearray ciphertext was accepted'
+
 
 def test_sealed_box_raises_error():
     with raises(TypeError):
@@ -38,6 +38,8 @@ def test_secret_box_encrypt_decrypt(key, msg, nonce):
     box = SecretBox(key)
     enc = box.encrypt(msg, nonce=nonce)
     assert box.decrypt(enc) == msg
+    assert box.decrypt(bytearray(enc)) == msg
+    assert enc == enc.nonce + enc.detached_mac + enc.detached_ciphertext
     # detached
     assert box.decrypt(enc.ciphertext, nonce=nonce) == msg
 
@@ -61,3 +63,19 @@ def test_secret_box_decrypt_invalid():
     # no mac!
     with raises(CryptoError):
         box.decrypt(m.detached_ciphertext, nonce=m.nonce)
+
+
+def test_secret_box_decrypt_bytearray_not_pinned():
+    box = SecretBox(random(SecretBox.KEY_SIZE))
+    m = box.encrypt(b'abcdef')
+
+    for buf, nonce in [(bytearray(m), None),
+                       (bytearray(m.ciphertext), m.nonce)]:
+        buf[-1] ^= 1
+        try:
+            box.decrypt(buf, nonce=nonce)
+        except CryptoError:
+            # no buffer export may outlive the failed call
+            buf.extend(b'x')
+        else:  # pragma: no cover
+            assert False, 'tampered ciphertext was decrypted'
@@ -1,4 +1,5 @@
-from monocypher.utils import Key
+from pytest import raises
+from monocypher.utils import Key, ensure_length, ensure_bytes_with_length, ensure_range
 
 
 class MyKey(Key):
@@ -14,7 +15,22 @@ def test_key():
     assert enc.encode() == bytes(32)
 
     # hashable
-    hash(enc)
+    assert hash(enc) == hash(bytes(32))
 
+    assert enc == enc
     assert enc == MyKey(bytes(32))
+    assert enc != MyKey(bytes(31) + b'\x01')
     assert enc != 1  # No TypeError / NotImplementedError is raised
+
+
+def test_ensure_helpers():
+    ensure_length('a', bytearray(4), 4)
+    ensure_bytes_with_length('a', bytes(4), 4)
+    ensure_range('a', 4, 0, 4)
+
+    with raises(TypeError, match='a must have length 4'):
+        ensure_length('a', bytes(3), 4)
+    with raises(TypeError, match='a must be bytes with length 4'):
+        ensure_bytes_with_length('a', bytearray(4), 4)
+    with raises(TypeError, match='a must be an integer between 0 and 4'):
+        ensure_range('a', 5, 0, 4)